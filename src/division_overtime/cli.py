@@ -8,7 +8,7 @@ from pathlib import Path
 
 from .backup_observability import BackupObservation, observe_automatic_backups
 from .backup_retention import AUTOMATIC_BACKUP_RETENTION, prune_backup_directories
-from .config import ConfigError, load_config, load_database_path, load_employee_csv_path
+from .config import ConfigError, load_config, load_data_paths, load_database_path
 from .database import SCHEMA_VERSION, Database
 from .database_observability import DatabaseObservation, observe_database
 from .employee_consistency import (
@@ -107,9 +107,10 @@ def _print_backup_observation(observation: BackupObservation) -> None:
 
 def _run_backups_command(args: argparse.Namespace) -> int:
     root = args.root.resolve()
+    database_path, employee_csv = load_data_paths(root)
     observations = observe_automatic_backups(
-        database_path=load_database_path(root),
-        employee_csv=load_employee_csv_path(root),
+        database_path=database_path,
+        employee_csv=employee_csv,
     )
     for observation in observations:
         _print_backup_observation(observation)
@@ -31,6 +31,7 @@ class AppConfig:
     read_timeout: float
     retry_count: int
     retry_backoff: float
+    kot_max_parallel: int
     default_target_minutes: int
     thresholds: tuple[int, ...]
     division_targets: dict[str, int]
@@ -100,6 +101,13 @@ def load_employee_csv_path(root: Path | None = None) -> Path:
     return root / raw["app"]["employee_csv"]
 
 
+def load_data_paths(root: Path | None = None) -> tuple[Path, Path]:
+    """Resolve the SQLite and employee CSV paths with a single config read."""
+    root = (root or Path.cwd()).resolve()
+    raw = _load_toml_config(root)
+    return root / raw["app"]["database_path"], root / raw["app"]["employee_csv"]
+
+
 def load_config(root: Path | None = None) -> AppConfig:
     root = (root or Path.cwd()).resolve()
     environment = _load_environment(root)
@@ -143,6 +151,7 @@ def load_config(root: Path | None = None) -> AppConfig:
         read_timeout=float(kot["read_timeout_seconds"]),
         retry_count=int(kot["retry_count"]),
         retry_backoff=float(kot["retry_backoff_seconds"]),
+        kot_max_parallel=int(kot.get("max_parallel_requests", 16)),
         default_target_minutes=int(overtime["default_target_minutes"]),
         thresholds=tuple(sorted(int(x) for x in overtime["thresholds"])),
         division_targets={str(k): int(v) for k, v in overtime["division_targets"].items()},
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import csv
 import logging
+import os
 import re
 import shutil
 import tempfile
@@ -54,13 +55,29 @@ def load_employees(path: Path) -> list[Employee]:
     employees: list[Employee] = []
     seen_codes: set[str] = set()
     with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        reader = csv.DictReader(handle)
+        reader = csv.reader(handle)
+        header = next(reader, None) or []
         required = {"社員番号", "キー", "氏", "名", "メールアドレス", "部署コード"}
-        missing = required - set(reader.fieldnames or [])
+        missing = required - set(header)
         if missing:
             raise EmployeeDataError(f"Missing CSV columns: {', '.join(sorted(missing))}")
+        column_index = {name: position for position, name in enumerate(header)}
+        idx_code = column_index["社員番号"]
+        idx_key = column_index["キー"]
+        idx_last_name = column_index["氏"]
+        idx_first_name = column_index["名"]
+        idx_email = column_index["メールアドレス"]
+        idx_division_code = column_index["部署コード"]
+        idx_division_name = column_index.get("部署名")
+        idx_personal_target = column_index.get("個人別残業上限分")
+
+        def optional_cell(row: list[str], index: int | None) -> str | None:
+            return row[index] if index is not None and index < len(row) else None
+
         for row_number, row in enumerate(reader, start=2):
-            code = row["社員番号"].strip()
+            if not row:
+                continue
+            code = row[idx_code].strip()
             if not code:
                 raise EmployeeDataError(f"Empty employee code at row {row_number}")
             if code in seen_codes:
@@ -69,14 +86,14 @@ def load_employees(path: Path) -> list[Employee]:
             employees.append(
                 Employee(
                     code=code,
-                    employee_key=row["キー"].strip(),
-                    last_name=row["氏"].strip(),
-                    first_name=row["名"].strip(),
-                    email=row["メールアドレス"].strip(),
-                    division_code=row["部署コード"].strip(),
-                    division_name=(row.get("部署名") or "").strip(),
+                    employee_key=row[idx_key].strip(),
+                    last_name=row[idx_last_name].strip(),
+                    first_name=row[idx_first_name].strip(),
+                    email=row[idx_email].strip(),
+                    division_code=row[idx_division_code].strip(),
+                    division_name=(optional_cell(row, idx_division_name) or "").strip(),
                     personal_target_minutes=_optional_non_negative_int(
-                        row.get("個人別残業上限分"), code
+                        optional_cell(row, idx_personal_target), code
                     ),
                 )
             )
@@ -137,14 +154,17 @@ def _prune_employee_csv_backups(
     pattern = re.compile(
         rf"^{re.escape(source_path.stem)}_\d{{8}}_\d{{12}}{re.escape(source_path.suffix)}$"
     )
-    backups = sorted(
-        candidate
-        for candidate in backup_dir.iterdir()
-        if not candidate.is_symlink()
-        and candidate.is_file()
-        and pattern.fullmatch(candidate.name)
-        and _is_employee_csv_backup_timestamp(candidate, source_path)
-    )
+    backups: list[Path] = []
+    with os.scandir(backup_dir) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if not pattern.fullmatch(entry.name):
+                continue
+            candidate = Path(entry.path)
+            if _is_employee_csv_backup_timestamp(candidate, source_path):
+                backups.append(candidate)
+    backups.sort()
     expired = backups[:-retention]
     for backup in expired:
         backup.unlink()
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import json
+import logging
 import time
 from collections.abc import Iterable
 from dataclasses import dataclass
+from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+_POOL_SIZE = 32
 
 
 class KingOfTimeError(RuntimeError):
@@ -28,18 +36,40 @@ class KingOfTimeClient:
         retry_count: int,
         retry_backoff: float,
         session: requests.Session | None = None,
+        cache_dir: Path | None = None,
+        current_month: str | None = None,
     ):
         self.base_url = base_url
         self.endpoint = endpoint
         self.timeout = (connect_timeout, read_timeout)
         self.retry_count = retry_count
         self.retry_backoff = retry_backoff
-        self.session = session or requests.Session()
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         self.session.headers.update({"Authorization": f"Bearer {token}"})
+        self.cache_dir = cache_dir
+        self.current_month = current_month
+        self._cache: dict[tuple[str, str], dict[str, MonthlyOvertime]] = {}
 
     def fetch_division_month(
         self, year_month: str, division_code: str
     ) -> dict[str, MonthlyOvertime]:
+        cached = self._cache.get((year_month, division_code))
+        if cached is not None:
+            return cached
+        payload = self._read_disk_cache(year_month, division_code)
+        if payload is None:
+            payload = self._request_month(year_month, division_code)
+            self._write_disk_cache(year_month, division_code, payload)
+        result = self._normalize(payload)
+        self._cache[(year_month, division_code)] = result
+        return result
+
+    def _request_month(self, year_month: str, division_code: str) -> list[object]:
         url = f"{self.base_url}{self.endpoint}/{year_month}"
         last_error: Exception | None = None
         for attempt in range(1, self.retry_count + 1):
@@ -53,7 +83,7 @@ class KingOfTimeClient:
                 payload = response.json()
                 if not isinstance(payload, list):
                     raise KingOfTimeError("Unexpected King of Time response format")
-                return self._normalize(payload)
+                return payload
             except (requests.RequestException, ValueError, KingOfTimeError) as exc:
                 last_error = exc
                 if attempt < self.retry_count:
@@ -62,6 +92,44 @@ class KingOfTimeClient:
             f"Failed to fetch {year_month} division={division_code}: {last_error}"
         )
 
+    def _is_closed_month(self, year_month: str) -> bool:
+        """Whether the month precedes the caller-supplied current month and is thus immutable."""
+        return self.current_month is not None and year_month < self.current_month
+
+    def _disk_cache_path(self, year_month: str, division_code: str) -> Path | None:
+        if self.cache_dir is None or not self._is_closed_month(year_month):
+            return None
+        return self.cache_dir / f"{year_month}_{division_code}.json"
+
+    def _read_disk_cache(self, year_month: str, division_code: str) -> list[object] | None:
+        path = self._disk_cache_path(year_month, division_code)
+        if path is None:
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return payload if isinstance(payload, list) else None
+
+    def _write_disk_cache(self, year_month: str, division_code: str, payload: list[object]) -> None:
+        path = self._disk_cache_path(year_month, division_code)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(path.name + ".tmp")
+            temp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            temp_path.replace(path)
+        except OSError:
+            logger.warning(
+                "kot_cache_write=failed year_month=%s division=%s path=%s",
+                year_month,
+                division_code,
+                path,
+                exc_info=True,
+            )
+
     @staticmethod
     def _normalize(records: Iterable[object]) -> dict[str, MonthlyOvertime]:
         result: dict[str, MonthlyOvertime] = {}
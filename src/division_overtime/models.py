@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True, slots=True)
@@ -27,15 +27,17 @@ class OvertimeSnapshot:
     previous_minutes: int
     target_minutes: int
     current_night_minutes: int = 0
+    target_percent: int = field(init=False)
+    previous_percent: int = field(init=False)
 
-    @property
-    def target_percent(self) -> int:
+    def __post_init__(self) -> None:
         if self.target_minutes == 0:
-            return 100 if self.current_minutes > 0 else 0
-        return round(self.current_minutes / self.target_minutes * 100)
-
-    @property
-    def previous_percent(self) -> int:
+            target_percent = 100 if self.current_minutes > 0 else 0
+        else:
+            target_percent = round(self.current_minutes / self.target_minutes * 100)
+        object.__setattr__(self, "target_percent", target_percent)
         if self.previous_minutes == 0:
-            return 0
-        return round(self.current_minutes / self.previous_minutes * 100)
+            previous_percent = 0
+        else:
+            previous_percent = round(self.current_minutes / self.previous_minutes * 100)
+        object.__setattr__(self, "previous_percent", previous_percent)
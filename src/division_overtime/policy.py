@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from .models import Employee, OvertimeSnapshot
 
 
+def division_recipients(
+    department_recipients: dict[str, tuple[str, ...]],
+    division_codes: Iterable[str],
+) -> dict[str, tuple[str, ...]]:
+    """Precompute the merged ALL + per-division recipient list for each division."""
+    all_recipients = department_recipients.get("ALL", ())
+    return {
+        division: tuple(sorted({*all_recipients, *department_recipients.get(division, ())}))
+        for division in division_codes
+    }
+
+
 def target_minutes(employee: Employee, division_targets: dict[str, int], default: int) -> int:
     if employee.personal_target_minutes is not None:
         return employee.personal_target_minutes
@@ -10,8 +24,11 @@ def target_minutes(employee: Employee, division_targets: dict[str, int], default
 
 
 def reached_threshold(percent: int, thresholds: tuple[int, ...]) -> int | None:
-    reached = [threshold for threshold in thresholds if percent >= threshold]
-    return max(reached) if reached else None
+    """Return the highest reached threshold; thresholds are sorted ascending by load_config."""
+    for threshold in reversed(thresholds):
+        if percent >= threshold:
+            return threshold
+    return None
 
 
 def notification_dedupe_key(
@@ -4,6 +4,7 @@ import logging
 import sqlite3
 import uuid
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import jpholiday
@@ -16,7 +17,12 @@ from .employee_source import CsvEmployeeSource, SqliteEmployeeSource
 from .king_of_time import KingOfTimeClient, MonthlyOvertime
 from .message_formatter import format_department_message, format_self_message
 from .models import OvertimeSnapshot
-from .policy import notification_dedupe_key, reached_threshold, target_minutes
+from .policy import (
+    division_recipients,
+    notification_dedupe_key,
+    reached_threshold,
+    target_minutes,
+)
 from .slack import SlackDeliveryError, SlackMessenger
 
 logger = logging.getLogger(__name__)
@@ -38,6 +44,77 @@ class DevelopmentKingOfTimeClient:
         }
 
 
+def _claim_sendable(
+    conn: sqlite3.Connection,
+    run_id: str,
+    mode: str,
+    recipient: str,
+    items: list[tuple[OvertimeSnapshot, int | None, str]],
+    now_iso: str,
+) -> list[tuple[OvertimeSnapshot, int | None, str]]:
+    """Mark new attempts pending and record duplicates as skipped rows."""
+    sendable: list[tuple[OvertimeSnapshot, int | None, str]] = []
+    for snapshot, threshold, dedupe in items:
+        try:
+            conn.execute(
+                "INSERT INTO notification_attempts("
+                "dedupe_key,run_id,employee_code,recipient,notification_type,"
+                "threshold_percent,status,attempt_count,created_at,updated_at"
+                ") VALUES(?,?,?,?,?,?, 'pending',0,?,?)",
+                (
+                    dedupe,
+                    run_id,
+                    snapshot.employee.code,
+                    recipient,
+                    mode,
+                    threshold,
+                    now_iso,
+                    now_iso,
+                ),
+            )
+            sendable.append((snapshot, threshold, dedupe))
+        except sqlite3.IntegrityError:
+            existing = conn.execute(
+                "SELECT id, run_id, status FROM notification_attempts "
+                "WHERE dedupe_key=? AND recipient=? AND status != 'skipped'",
+                (dedupe, recipient),
+            ).fetchone()
+            stale_pending = (
+                existing is not None
+                and existing["status"] == "pending"
+                and existing["run_id"] != run_id
+            )
+            if existing and (existing["status"] == "failed" or stale_pending):
+                conn.execute(
+                    "UPDATE notification_attempts SET run_id=?, status='pending', "
+                    "error_message=NULL, updated_at=? "
+                    "WHERE dedupe_key=? AND recipient=? AND status != 'skipped'",
+                    (run_id, now_iso, dedupe, recipient),
+                )
+                sendable.append((snapshot, threshold, dedupe))
+            else:
+                conn.execute(
+                    "INSERT INTO notification_attempts("
+                    "dedupe_key,run_id,employee_code,recipient,notification_type,"
+                    "threshold_percent,status,attempt_count,duplicate_of_attempt_id,"
+                    "created_at,updated_at"
+                    ") VALUES(?,?,?,?,?,?,'skipped',0,?,?,?)",
+                    (
+                        dedupe,
+                        run_id,
+                        snapshot.employee.code,
+                        recipient,
+                        mode,
+                        threshold,
+                        existing["id"] if existing else None,
+                        now_iso,
+                        now_iso,
+                    ),
+                )
+                logger.info("Duplicate notification skipped: %s -> %s", dedupe, recipient)
+    return sendable
+
+
 def run(
     config: AppConfig,
     mode: str,
@@ -56,8 +133,8 @@ def run(
     db.initialize()
     db.start_run(run_id, mode, now, effective_dry_run, source)
     try:
-        if mode == "threshold" and jpholiday.is_holiday(now.date()):
-            logger.info("Japanese public holiday: threshold notification skipped")
+        if mode == "threshold" and (now.weekday() >= 5 or jpholiday.is_holiday(now.date())):
+            logger.info("Weekend or Japanese public holiday: threshold notification skipped")
             db.finish_run(run_id, datetime.now(config.timezone), "succeeded")
             return 0
         employees = CsvEmployeeSource(config.employee_csv).list_employees()
@@ -65,6 +142,8 @@ def run(
             employees,
             SqliteEmployeeSource(EmployeeRepository(db)),
         )
+        current_month = now.strftime("%Y-%m")
+        previous_month = (now.replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
         if config.environment == "development":
             client = DevelopmentKingOfTimeClient(
                 tuple(employee.employee_key for employee in employees)
@@ -79,23 +158,39 @@ def run(
                 config.read_timeout,
                 config.retry_count,
                 config.retry_backoff,
+                cache_dir=config.root / "var" / "cache" / "king-of-time",
+                current_month=current_month,
             )
             messenger = SlackMessenger(config.slack_token)
-        current_month = now.strftime("%Y-%m")
-        previous_month = (now.replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
         division_codes = sorted({employee.division_code for employee in employees})
-        current_by_division = {
-            division: client.fetch_division_month(current_month, division)
+        fetch_pairs = [
+            (month, division)
+            for month in (current_month, previous_month)
             for division in division_codes
+        ]
+        max_workers = max(1, min(config.kot_max_parallel, len(fetch_pairs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = dict(
+                zip(
+                    fetch_pairs,
+                    executor.map(lambda pair: client.fetch_division_month(*pair), fetch_pairs),
+                    strict=True,
+                )
+            )
+        current_by_division = {
+            division: fetched[(current_month, division)] for division in division_codes
         }
         previous_by_division = {
-            division: client.fetch_division_month(previous_month, division)
-            for division in division_codes
+            division: fetched[(previous_month, division)] for division in division_codes
         }
 
+        recipients_by_division = division_recipients(config.department_recipients, division_codes)
+        now_iso = now.isoformat()
+        iso_year, iso_week = now.isocalendar()[:2]
         reports_by_delivery: dict[
             tuple[str, str], list[tuple[OvertimeSnapshot, int | None, str]]
         ] = defaultdict(list)
+        snapshot_rows: list[tuple[object, ...]] = []
         with db.transaction() as conn:
             for employee in employees:
                 current_overtime = current_by_division[employee.division_code].get(
@@ -122,12 +217,7 @@ def run(
                         else 0
                     ),
                 )
-                conn.execute(
-                    "INSERT INTO overtime_snapshots("
-                    "run_id,target_month,employee_code,employee_name,division_code,"
-                    "current_minutes,current_night_minutes,previous_minutes,target_minutes,"
-                    "target_percent,captured_at"
-                    ") VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+                snapshot_rows.append(
                     (
                         run_id,
                         current_month,
@@ -139,8 +229,8 @@ def run(
                         snapshot.previous_minutes,
                         snapshot.target_minutes,
                         snapshot.target_percent,
-                        now.isoformat(),
-                    ),
+                        now_iso,
+                    )
                 )
                 threshold = (
                     None
@@ -149,10 +239,8 @@ def run(
                 )
                 if mode == "threshold" and threshold is None:
                     continue
-                dedupe = notification_dedupe_key(snapshot, mode, threshold, *now.isocalendar()[:2])
-                recipients = set(config.department_recipients.get("ALL", ()))
-                recipients.update(config.department_recipients.get(employee.division_code, ()))
-                for recipient in recipients:
+                dedupe = notification_dedupe_key(snapshot, mode, threshold, iso_year, iso_week)
+                for recipient in recipients_by_division[employee.division_code]:
                     reports_by_delivery[(recipient, "department")].append(
                         (snapshot, threshold, dedupe)
                     )
@@ -167,71 +255,26 @@ def run(
                     reports_by_delivery[(employee.email, f"self:{employee.code}")].append(
                         (snapshot, threshold, dedupe + ":self")
                     )
+            conn.executemany(
+                "INSERT INTO overtime_snapshots("
+                "run_id,target_month,employee_code,employee_name,division_code,"
+                "current_minutes,current_night_minutes,previous_minutes,target_minutes,"
+                "target_percent,captured_at"
+                ") VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+                snapshot_rows,
+            )
 
         failed = 0
-        for (recipient, delivery_type), items in reports_by_delivery.items():
-            sendable: list[tuple[OvertimeSnapshot, int | None, str]] = []
-            if effective_dry_run:
-                sendable = items
-            else:
-                with db.transaction() as conn:
-                    for snapshot, threshold, dedupe in items:
-                        try:
-                            conn.execute(
-                                "INSERT INTO notification_attempts("
-                                "dedupe_key,run_id,employee_code,recipient,notification_type,"
-                                "threshold_percent,status,attempt_count,created_at,updated_at"
-                                ") VALUES(?,?,?,?,?,?, 'pending',0,?,?)",
-                                (
-                                    dedupe,
-                                    run_id,
-                                    snapshot.employee.code,
-                                    recipient,
-                                    mode,
-                                    threshold,
-                                    now.isoformat(),
-                                    now.isoformat(),
-                                ),
-                            )
-                            sendable.append((snapshot, threshold, dedupe))
-                        except sqlite3.IntegrityError:
-                            existing = conn.execute(
-                                "SELECT id, run_id, status FROM notification_attempts "
-                                "WHERE dedupe_key=? AND recipient=? AND status != 'skipped'",
-                                (dedupe, recipient),
-                            ).fetchone()
-                            if existing and existing["status"] == "failed":
-                                conn.execute(
-                                    "UPDATE notification_attempts SET run_id=?, status='pending', "
-                                    "error_message=NULL, updated_at=? "
-                                    "WHERE dedupe_key=? AND recipient=? AND status != 'skipped'",
-                                    (run_id, now.isoformat(), dedupe, recipient),
-                                )
-                                sendable.append((snapshot, threshold, dedupe))
-                            else:
-                                conn.execute(
-                                    "INSERT INTO notification_attempts("
-                                    "dedupe_key,run_id,employee_code,recipient,notification_type,"
-                                    "threshold_percent,status,attempt_count,duplicate_of_attempt_id,"
-                                    "created_at,updated_at"
-                                    ") VALUES(?,?,?,?,?,?,'skipped',0,?,?,?)",
-                                    (
-                                        dedupe,
-                                        run_id,
-                                        snapshot.employee.code,
-                                        recipient,
-                                        mode,
-                                        threshold,
-                                        existing["id"] if existing else None,
-                                        now.isoformat(),
-                                        now.isoformat(),
-                                    ),
-                                )
-                                logger.info(
-                                    "Duplicate notification skipped: %s -> %s", dedupe, recipient
-                                )
-            if not sendable:
-                continue
+        if effective_dry_run:
+            sendable_by_delivery = dict(reports_by_delivery)
+        else:
+            sendable_by_delivery = {}
+            with db.transaction() as conn:
+                for (recipient, delivery_type), items in reports_by_delivery.items():
+                    sendable = _claim_sendable(conn, run_id, mode, recipient, items, now_iso)
+                    if sendable:
+                        sendable_by_delivery[(recipient, delivery_type)] = sendable
+        for (recipient, delivery_type), sendable in sendable_by_delivery.items():
             snapshots = [snapshot for snapshot, _, _ in sendable]
             message = (
                 format_self_message(snapshots[0])
@@ -248,21 +291,17 @@ def run(
             except SlackDeliveryError as exc:
                 failed += 1
                 status, slack_ts, error = "failed", None, str(exc)
+            updated_iso = datetime.now(config.timezone).isoformat()
             with db.transaction() as conn:
-                for _, _, dedupe in sendable:
-                    conn.execute(
-                        "UPDATE notification_attempts SET status=?, attempt_count=attempt_count+1,"
-                        "slack_timestamp=?, error_message=?, updated_at=? "
-                        "WHERE dedupe_key=? AND recipient=? AND status != 'skipped'",
-                        (
-                            status,
-                            slack_ts,
-                            error,
-                            datetime.now(config.timezone).isoformat(),
-                            dedupe,
-                            recipient,
-                        ),
-                    )
+                conn.executemany(
+                    "UPDATE notification_attempts SET status=?, attempt_count=attempt_count+1,"
+                    "slack_timestamp=?, error_message=?, updated_at=? "
+                    "WHERE dedupe_key=? AND recipient=? AND status != 'skipped'",
+                    [
+                        (status, slack_ts, error, updated_iso, dedupe, recipient)
+                        for _, _, dedupe in sendable
+                    ],
+                )
         db.finish_run(
             run_id,
             datetime.now(config.timezone),
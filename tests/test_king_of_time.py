@@ -3,6 +3,43 @@ from __future__ import annotations
 from division_overtime.king_of_time import KingOfTimeClient, MonthlyOvertime
 
 
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.headers: dict[str, str] = {}
+        self.payload = payload
+        self.request_count = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.request_count += 1
+        return FakeResponse(self.payload)
+
+
+def make_client(session: FakeSession, cache_dir=None, current_month=None) -> KingOfTimeClient:
+    return KingOfTimeClient(
+        "https://example.invalid",
+        "/api/overtime",
+        "kot-token",
+        3.0,
+        10.0,
+        1,
+        0.0,
+        session=session,
+        cache_dir=cache_dir,
+        current_month=current_month,
+    )
+
+
 def test_normalize_preserves_total_and_night_overtime():
     result = KingOfTimeClient._normalize(
         [
@@ -38,3 +75,74 @@ def test_normalize_treats_missing_or_null_night_overtime_as_zero():
         "missing-night": MonthlyOvertime(60, 0),
         "null-night": MonthlyOvertime(120, 0),
     }
+
+
+def test_fetch_division_month_reuses_cached_response():
+    session = FakeSession([{"employeeKey": "test-employee-key", "overtime": 30}])
+    client = make_client(session)
+
+    first = client.fetch_division_month("2026-07", "300")
+    second = client.fetch_division_month("2026-07", "300")
+
+    assert session.request_count == 1
+    assert second == first
+
+
+def test_fetch_division_month_caches_each_month_and_division_separately():
+    session = FakeSession([{"employeeKey": "test-employee-key", "overtime": 30}])
+    client = make_client(session)
+
+    client.fetch_division_month("2026-07", "300")
+    client.fetch_division_month("2026-06", "300")
+    client.fetch_division_month("2026-07", "158")
+
+    assert session.request_count == 3
+
+
+def test_closed_month_is_served_from_disk_cache_across_clients(tmp_path):
+    payload = [{"employeeKey": "test-employee-key", "overtime": 30}]
+    first_session = FakeSession(payload)
+    make_client(first_session, cache_dir=tmp_path, current_month="2000-02").fetch_division_month(
+        "2000-01", "300"
+    )
+    assert first_session.request_count == 1
+    assert (tmp_path / "2000-01_300.json").exists()
+
+    second_session = FakeSession(payload)
+    result = make_client(
+        second_session, cache_dir=tmp_path, current_month="2000-02"
+    ).fetch_division_month("2000-01", "300")
+
+    assert second_session.request_count == 0
+    assert result == {"test-employee-key": MonthlyOvertime(30, 0)}
+
+
+def test_current_month_is_never_cached_on_disk(tmp_path):
+    session = FakeSession([{"employeeKey": "test-employee-key", "overtime": 30}])
+    client = make_client(session, cache_dir=tmp_path, current_month="2026-07")
+
+    client.fetch_division_month("2026-07", "300")
+
+    assert session.request_count == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_no_month_is_cached_without_a_current_month(tmp_path):
+    session = FakeSession([{"employeeKey": "test-employee-key", "overtime": 30}])
+
+    make_client(session, cache_dir=tmp_path).fetch_division_month("2000-01", "300")
+
+    assert session.request_count == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_corrupt_disk_cache_falls_back_to_http(tmp_path):
+    (tmp_path / "2000-01_300.json").write_text("not json", encoding="utf-8")
+    session = FakeSession([{"employeeKey": "test-employee-key", "overtime": 30}])
+
+    result = make_client(session, cache_dir=tmp_path, current_month="2000-02").fetch_division_month(
+        "2000-01", "300"
+    )
+
+    assert session.request_count == 1
+    assert result == {"test-employee-key": MonthlyOvertime(30, 0)}
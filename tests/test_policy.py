@@ -1,7 +1,12 @@
 import pytest
 
 from division_overtime.models import Employee, OvertimeSnapshot
-from division_overtime.policy import notification_dedupe_key, reached_threshold, target_minutes
+from division_overtime.policy import (
+    division_recipients,
+    notification_dedupe_key,
+    reached_threshold,
+    target_minutes,
+)
 
 
 def employee(personal=None):
@@ -53,3 +58,24 @@ def test_threshold_dedupe_key_includes_threshold():
     assert notification_dedupe_key(snapshot, "threshold", 60, 2026, 30) == (
         "threshold:2026-W30:00001:60"
     )
+
+
+def test_division_recipients_merges_all_with_specific_mapping():
+    mapping = {
+        "ALL": ("admin@example.com",),
+        "300": ("manager300@example.com", "admin@example.com"),
+    }
+
+    result = division_recipients(mapping, ["158", "300"])
+
+    assert result == {
+        "158": ("admin@example.com",),
+        "300": ("admin@example.com", "manager300@example.com"),
+    }
+
+
+def test_division_recipients_without_all_mapping():
+    assert division_recipients({"300": ("manager300@example.com",)}, ["300", "999"]) == {
+        "300": ("manager300@example.com",),
+        "999": (),
+    }
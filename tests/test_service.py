@@ -69,6 +69,17 @@ class FailingMessenger:
         raise SlackDeliveryError("temporary Slack failure")
 
 
+class CrashingMessenger:
+    calls: list[tuple[str, str]] = []
+
+    def __init__(self, token: str):
+        pass
+
+    def send_dm(self, recipient: str, message: str) -> str:
+        self.calls.append((recipient, message))
+        raise ConnectionError("socket closed")
+
+
 def make_config(tmp_path: Path) -> AppConfig:
     employee_csv = tmp_path / "employeeKey.csv"
     employee_csv.write_text(
@@ -93,6 +104,7 @@ def make_config(tmp_path: Path) -> AppConfig:
         read_timeout=10.0,
         retry_count=2,
         retry_backoff=0.1,
+        kot_max_parallel=4,
         default_target_minutes=600,
         thresholds=(60, 70, 80, 90, 100),
         division_targets={"300": 600},
@@ -190,6 +202,45 @@ def test_failed_notification_is_retried_and_marked_sent(
     assert len(SuccessfulMessenger.calls) == 1
 
 
+def test_threshold_run_is_skipped_on_weekends(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    class SaturdayDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            value = cls(2026, 7, 25, 10, 30, 0)
+            return value.replace(tzinfo=tz) if tz else value
+
+    config = make_config(tmp_path)
+    patch_external_services(monkeypatch, SuccessfulMessenger)
+    monkeypatch.setattr("division_overtime.service.datetime", SaturdayDateTime)
+
+    assert run(config, "threshold") == 0
+
+    assert fetch_attempts(config.database_path) == []
+    assert SuccessfulMessenger.calls == []
+
+
+def test_stale_pending_attempt_from_aborted_run_is_retried(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    config = make_config(tmp_path)
+    patch_external_services(monkeypatch, CrashingMessenger)
+
+    assert run(config, "threshold") == 1
+    stale = fetch_attempts(config.database_path)
+    assert len(stale) == 1
+    assert stale[0]["status"] == "pending"
+    assert stale[0]["attempt_count"] == 0
+
+    patch_external_services(monkeypatch, SuccessfulMessenger)
+    assert run(config, "threshold") == 0
+
+    attempts = fetch_attempts(config.database_path)
+    assert len(attempts) == 1
+    assert attempts[0]["status"] == "sent"
+    assert attempts[0]["attempt_count"] == 1
+    assert len(SuccessfulMessenger.calls) == 1
+
+
 def test_dry_run_does_not_consume_notification_state(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ):